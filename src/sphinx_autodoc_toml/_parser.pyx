@@ -0,0 +1,103 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional C accelerator for the parser's line pre-pass.
+
+Implements the same single-pass line scan as the pure-Python
+TomlDocParser preprocessing (line offsets, stripped content spans and
+LINE_* classification codes) as compiled C. parser.py imports this module
+if it has been built and falls back to the pure-Python implementation
+otherwise, so it is never required.
+
+The project's uv_build backend does not compile extension modules, so
+this file is not built as part of the normal wheel. Build it in place
+with::
+
+    pip install cython
+    cythonize -i src/sphinx_autodoc_toml/_parser.pyx
+"""
+
+# Classification codes; must stay in sync with the LINE_* constants in
+# parser.py.
+cdef int LINE_BLANK = 0
+cdef int LINE_DOC_COMMENT = 1
+cdef int LINE_COMMENT = 2
+cdef int LINE_TABLE = 3
+cdef int LINE_KEY = 4
+cdef int LINE_OTHER = 5
+
+
+cdef inline bint _is_ws(unsigned char c):
+    return c == 0x20 or c == 0x09 or c == 0x0D
+
+
+cdef inline bint _is_key_char(unsigned char c):
+    return (
+        (c >= 0x61 and c <= 0x7A)  # a-z
+        or (c >= 0x41 and c <= 0x5A)  # A-Z
+        or (c >= 0x30 and c <= 0x39)  # 0-9
+        or c == 0x5F  # _
+        or c == 0x2D  # -
+    )
+
+
+def classify_lines(bytes buf):
+    """
+    Scan the buffer once, producing line offsets, content spans and codes.
+
+    Args:
+        buf: The raw file content
+
+    Returns:
+        Tuple of (offsets, span_start, span_end, classes) lists matching
+        the pure-Python preprocessing in parser.py
+    """
+    cdef const unsigned char* data = buf
+    cdef Py_ssize_t size = len(buf)
+    cdef Py_ssize_t pos = 0, start, j, k, end
+    cdef unsigned char first
+
+    offsets = [0]
+    span_start = []
+    span_end = []
+    classes = []
+
+    start = 0
+    while start <= size:
+        # Find the end of the current line
+        pos = start
+        while pos < size and data[pos] != 0x0A:
+            pos += 1
+        end = pos
+
+        # Strip leading and trailing whitespace
+        j = start
+        while j < end and _is_ws(data[j]):
+            j += 1
+        if j >= end:
+            span_start.append(j)
+            span_end.append(j)
+            classes.append(LINE_BLANK)
+        else:
+            k = end
+            while k > j and _is_ws(data[k - 1]):
+                k -= 1
+            span_start.append(j)
+            span_end.append(k)
+            first = data[j]
+            if first == 0x23:  # '#'
+                if j + 1 < end and data[j + 1] == 0x3A:  # ':'
+                    classes.append(LINE_DOC_COMMENT)
+                else:
+                    classes.append(LINE_COMMENT)
+            elif first == 0x5B:  # '['
+                classes.append(LINE_TABLE)
+            elif _is_key_char(first):
+                classes.append(LINE_KEY)
+            else:
+                classes.append(LINE_OTHER)
+
+        if pos < size:
+            offsets.append(pos + 1)
+        start = pos + 1
+
+    offsets.append(size + 1)
+    return offsets, span_start, span_end, classes
@@ -41,8 +41,15 @@
    :status: implemented
    :tags: sphinx, ui
    :links: R_SPHINX_007
+
+.. spec:: The extension MUST pre-schedule TOML parses before documents are read.
+   :id: S_EXT_008
+   :status: implemented
+   :tags: sphinx, performance, parallelism
+   :links: R_SPHINX_008
 """
 
+import re
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -52,10 +59,31 @@ from docutils.statemachine import ViewList
 from sphinx.application import Sphinx
 from sphinx.util import logging
 
-from sphinx_autodoc_toml.parser import DocComment, parse_toml_file
+from sphinx_autodoc_toml.parser import DocComment, parse_toml_file, parse_toml_file_async
 
 logger = logging.getLogger(__name__)
 
+# Translation table for deriving section ids from dotted TOML paths; a
+# single C-level translate pass beats str.replace in the per-doc-comment
+# node generation loop.
+_DOT_TO_DASH = str.maketrans(".", "-")
+
+# Conservative detection of reStructuredText syntax in doc-comment content.
+# Anything that could be inline markup (*, `, _, |, :, \), an explicit
+# markup block (..), a list or quote marker, a section underline, or an
+# indented line (indentation is structurally significant in reST:
+# definition lists, block quotes, literal blocks) forces the full
+# nested_parse path; content matching none of these renders identically
+# as plain paragraphs.
+_REST_HINT_RE = re.compile(
+    r"[*`_|:\\]"
+    r"|^[ \t]"
+    r"|^\s*\.\.(?:\s|$)"
+    r"|^\s*(?:[-+#>]|\d+[.)])\s"
+    r"|^\s*[=\-~^\"'+]{3,}\s*$",
+    re.M,
+)
+
 
 class AutodocTomlDirective(Directive):
     """
@@ -104,8 +132,21 @@ class AutodocTomlDirective(Directive):
             )
             return []
 
-        # Parse the TOML file and extract doc-comments
+        # Parse the TOML file and extract doc-comments. Synchronous on
+        # purpose: under parallel reads (-j N) run() executes in forked
+        # workers where pool futures from the parent are unusable; the
+        # fork-copied parse cache still delivers the prefetch win.
         try:
+            # Cheapest rejection first: a file without any "#:" bytes cannot
+            # yield doc-comments, so skip the parse machinery entirely
+            # unless :show-all: asks for everything regardless.
+            if "show-all" not in self.options and b"#:" not in toml_path.read_bytes():
+                logger.info(
+                    f"No doc-comments found in {toml_path}",
+                    location=(env.docname, self.lineno),
+                )
+                return []
+
             doc_comments = parse_toml_file(toml_path)
         except Exception as e:
             logger.error(
@@ -149,22 +190,31 @@ class AutodocTomlDirective(Directive):
         if doc_comment.path:
             # Create a title node for the TOML path
             title_text = doc_comment.toml_path
-            section_id = f"toml-{doc_comment.full_path.replace('.', '-')}"
+            section_id = f"toml-{doc_comment.full_path.translate(_DOT_TO_DASH)}"
 
             # Create a rubric (subheading) for the TOML item
             rubric = nodes.rubric(text=title_text)
             rubric["ids"].append(section_id)
             result.append(rubric)
 
-        # Parse the doc-comment content and insert it into the document
-        if doc_comment.content or doc_comment.toml_content:
+        # Parse the doc-comment content and insert it into the document.
+        # Whitespace-only content with no TOML to show means there is
+        # nothing to parse, so skip the container and nested_parse entirely.
+        if doc_comment.content.strip() or doc_comment.toml_content:
+            # Plain-text content (no reST syntax) renders as simple
+            # paragraphs, so build the nodes directly and skip the full
+            # reST state machine - by far the most expensive step here.
+            if _REST_HINT_RE.search(doc_comment.content) is None:
+                result.append(self._build_plain_container(doc_comment))
+                return result
+
             # Build the combined RST content using ViewList for proper source tracking
             rst_content: ViewList = ViewList()
             source_name = str(toml_path)
 
-            # Add the doc-comment content (split into individual lines)
+            # Add the doc-comment content (pre-split at parse time)
             if doc_comment.content:
-                for i, line in enumerate(doc_comment.content.split("\n")):
+                for i, line in enumerate(doc_comment.content_lines):
                     rst_content.append(line, source_name, doc_comment.line_number + i)
 
             # Add the collapsible admonition with TOML code
@@ -172,7 +222,7 @@ class AutodocTomlDirective(Directive):
                 # Calculate the line offset for the admonition content
                 current_line = doc_comment.line_number
                 if doc_comment.content:
-                    current_line += len(doc_comment.content.split("\n"))
+                    current_line += len(doc_comment.content_lines)
                     # Add a blank line before the admonition if there's doc-comment content
                     rst_content.append("", source_name, current_line)
                     current_line += 1
@@ -199,8 +249,10 @@ class AutodocTomlDirective(Directive):
             # Use the ViewList (no need to create a separate StringList)
             content_string_list = rst_content
 
-            # Create a container node to hold the parsed content
-            container = nodes.container()
+            # Create a container node to hold the parsed content. The
+            # rawsource lets docutils/Sphinx recognize unchanged subtrees
+            # during incremental builds.
+            container = nodes.container(rawsource=doc_comment.content)
             container["classes"].append("toml-doc-comment")
 
             # Use nested_parse to parse the content as reStructuredText
@@ -212,6 +264,80 @@ class AutodocTomlDirective(Directive):
 
         return result
 
+    def _build_plain_container(self, doc_comment: DocComment) -> nodes.container:
+        """
+        Build nodes for a doc-comment containing no reST syntax.
+
+        Produces the same structure nested_parse would for plain text:
+        one paragraph per blank-line-separated chunk, followed by the
+        collapsible admonition holding the TOML content.
+
+        Args:
+            doc_comment: The DocComment object
+
+        Returns:
+            The container node holding the generated content
+        """
+        container = nodes.container(rawsource=doc_comment.content)
+        container["classes"].append("toml-doc-comment")
+
+        # Blank lines separate paragraphs; the trailing sentinel flushes
+        # the final paragraph.
+        paragraph_lines: List[str] = []
+        for line in (*doc_comment.content_lines, ""):
+            if line.strip():
+                paragraph_lines.append(line)
+            elif paragraph_lines:
+                container += nodes.paragraph(text="\n".join(paragraph_lines))
+                paragraph_lines = []
+
+        if doc_comment.toml_content:
+            # Equivalent of the ".. admonition:: View Configuration" block
+            # with ":class: dropdown" and a toml code-block inside.
+            admonition = nodes.admonition()
+            admonition["classes"].append("dropdown")
+            admonition += nodes.title(text="View Configuration")
+            literal = nodes.literal_block(doc_comment.toml_content, doc_comment.toml_content)
+            literal["language"] = "toml"
+            literal["linenos"] = True
+            literal["xml:space"] = "preserve"
+            admonition += literal
+            container += admonition
+
+        return container
+
+
+# Matches autodoc-toml directive usages when scanning raw document source
+# during the prefetch pass.
+_DIRECTIVE_RE = re.compile(r"^\s*\.\.\s+autodoc-toml::\s*(\S.*?)\s*$", re.M)
+
+
+def _prefetch_toml_parses(app: Sphinx, env: Any, docnames: List[str]) -> None:
+    """
+    Pre-schedule parses for every TOML file referenced by docs about to be read.
+
+    Scans the raw source of each scheduled document for autodoc-toml
+    directives and submits their TOML files to the parse pool, so the
+    results are typically cached by the time the directives execute.
+
+    Args:
+        app: The Sphinx application instance
+        env: The build environment
+        docnames: Names of the documents about to be read
+    """
+    source_dir = Path(env.srcdir)
+    for docname in docnames:
+        try:
+            source = Path(env.doc2path(docname)).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        for match in _DIRECTIVE_RE.finditer(source):
+            toml_path = Path(match.group(1))
+            if not toml_path.is_absolute():
+                toml_path = source_dir / toml_path
+            if toml_path.exists():
+                parse_toml_file_async(toml_path)
+
 
 def setup(app: Sphinx) -> Dict[str, Any]:
     """
@@ -226,6 +352,9 @@ def setup(app: Sphinx) -> Dict[str, Any]:
     # Register the autodoc-toml directive
     app.add_directive("autodoc-toml", AutodocTomlDirective)
 
+    # Warm the parse cache while Sphinx is still reading documents
+    app.connect("env-before-read-docs", _prefetch_toml_parses)
+
     return {
         "version": "0.1.0",
         "parallel_read_safe": True,
@@ -59,45 +59,222 @@
    :status: implemented
    :tags: parser, extraction
    :links: R_PARSE_007
+
+.. spec:: The parser MUST cache parse results per file, invalidated by mtime and size.
+   :id: S_PARSER_011
+   :status: implemented
+   :tags: parser, performance, caching
+   :links: R_PARSE_008
+
+.. spec:: The parser MUST support scheduling parses on a background thread pool.
+   :id: S_PARSER_012
+   :status: implemented
+   :tags: parser, performance, parallelism
+   :links: R_SPHINX_008
 """
 
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import tomlkit
-from tomlkit.items import Table
+from tomlkit.items import AoT, Table
+
+# numpy is not a dependency of this extension, but when it happens to be
+# available the newline scan over large files vectorizes in one C pass.
+try:
+    import numpy as _np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    _np = None  # type: ignore[assignment]
+
+# Optional compiled accelerator for the line pre-pass. The .pyx source
+# ships with the package but is only built on demand (see _parser.pyx);
+# when the module is absent the pure-Python scan below is used.
+try:
+    from sphinx_autodoc_toml import _parser as _accel  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - exercised when not compiled
+    _accel = None  # type: ignore[assignment]
+
+# Lookup table of bytes allowed in a bare TOML key ([a-zA-Z0-9_-]), used by
+# _match_key to scan candidate lines without a regex call.
+_KEY_CHARS = bytes(
+    1 if chr(c).isascii() and (chr(c).isalnum() or chr(c) in "_-") else 0 for c in range(256)
+)
+
+# Line classification codes produced by _classify_lines. Every line is
+# assigned exactly one code in a single pass; the parse loop then branches
+# on small integers instead of re-running string predicates per line.
+LINE_BLANK = 0
+LINE_DOC_COMMENT = 1
+LINE_COMMENT = 2
+LINE_TABLE = 3
+LINE_KEY = 4
+LINE_OTHER = 5
+
+
+# Whitespace bytes skipped when classifying a line (space, tab, CR).
+_WS_BYTES = (0x20, 0x09, 0x0D)
+
+# Byte-level table pattern, compiled once at import and run with fullmatch
+# against a whitespace-stripped span: an optional second bracket pair
+# covers array-of-tables headers ([[name]]), whitespace around the name is
+# legal TOML and is trimmed by the capture, a whitespace-only name like
+# [ ] is rejected, and only an optional trailing comment may follow the
+# closing bracket. Only the captured name is ever decoded.
+TABLE_PATTERN = re.compile(rb"\[(?:\[)?\s*([^\]\s](?:[^\]]*[^\]\s])?)\s*\](?:\])?\s*(?:#.*)?")
+
+
+def _strip_doc(line: bytes) -> str:
+    """
+    Strip the ``#:`` marker and one optional following space or tab.
+
+    Replaces what used to be a per-line regex capture; callers only pass
+    spans already classified as doc-comment lines, so the marker is known
+    to be present and a plain slice suffices.
+
+    Args:
+        line: The (stripped) doc-comment line bytes
+
+    Returns:
+        The doc-comment text
+    """
+    rest = line[2:]
+    if rest[:1] in (b" ", b"\t"):
+        rest = rest[1:]
+    return rest.decode("utf-8")
+
+
+# Memoized table-path splits, shared across parser instances. Headers like
+# [tool.poetry.dependencies] repeat within and across files; each distinct
+# header is split and interned once and every occurrence reuses the tuple.
+_TABLE_PATH_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+
+def _split_table_path(table_path: str) -> Tuple[str, ...]:
+    """
+    Split a dotted table path into an interned component tuple.
+
+    Args:
+        table_path: The raw dotted path (e.g., "project.dependencies")
+
+    Returns:
+        Tuple of interned path components
+    """
+    parts = _TABLE_PATH_CACHE.get(table_path)
+    if parts is None:
+        parts = tuple(sys.intern(p) for p in table_path.split("."))
+        _TABLE_PATH_CACHE[table_path] = parts
+    return parts
+
+
+# Memoized (table path, key) -> full item path tuples, so every doc-comment
+# on the same key across rebuilds and files shares one tuple.
+_KEY_PATH_CACHE: Dict[Tuple[Tuple[str, ...], str], Tuple[str, ...]] = {}
+
+
+def _key_path(table: Tuple[str, ...], key: str) -> Tuple[str, ...]:
+    """
+    Return the full path tuple for a key within a table, memoized.
+
+    Args:
+        table: The enclosing table path
+        key: The (interned) key name
+
+    Returns:
+        The combined path tuple
+    """
+    cache_key = (table, key)
+    path = _KEY_PATH_CACHE.get(cache_key)
+    if path is None:
+        path = table + (key,)
+        _KEY_PATH_CACHE[cache_key] = path
+    return path
+
+
+# Memoized dotted joins keyed by path tuple; DocComment.full_path for
+# repeated paths resolves to the same string object.
+_FULL_PATH_CACHE: Dict[Tuple[str, ...], str] = {}
+
+
+def _match_key(line: bytes) -> Optional[str]:
+    """
+    Match a bare key assignment at the start of a line.
+
+    Equivalent to the regex ``^([a-zA-Z0-9_-]+)\\s*=`` but implemented as a
+    direct byte scan, which avoids the regex dispatch overhead on the
+    parser's hottest path.
+
+    Args:
+        line: The (stripped) line bytes to inspect
+
+    Returns:
+        The key name if the line is a key assignment, None otherwise
+    """
+    i = 0
+    n = len(line)
+    while i < n and _KEY_CHARS[line[i]]:
+        i += 1
+    if i == 0:
+        return None
+    # Skip optional whitespace between the key and the equals sign
+    j = i
+    while j < n and (line[j] == 0x20 or line[j] == 0x09):
+        j += 1
+    if j < n and line[j] == 0x3D:  # '='
+        # Key names repeat heavily across tables and files; intern them so
+        # every occurrence shares one string object.
+        return sys.intern(line[:i].decode("ascii"))
+    return None
 
 
 class DocComment:
-    """Represents a doc-comment block extracted from a TOML file."""
+    """Represents a doc-comment block extracted from a TOML file.
 
-    def __init__(self, path: List[str], content: str, line_number: int, toml_content: str = ""):
+    Declares ``__slots__`` so instances carry no per-object ``__dict__``;
+    large files produce many DocComments and the extension reads their
+    attributes repeatedly while generating nodes.
+    """
+
+    __slots__ = (
+        "path",
+        "content",
+        "content_lines",
+        "line_number",
+        "toml_content",
+        "full_path",
+        "toml_path",
+    )
+
+    def __init__(self, path: Sequence[str], content: str, line_number: int, toml_content: str = ""):
         """
         Initialize a DocComment.
 
         Args:
-            path: The TOML path to the item (e.g., ["project", "dependencies"])
+            path: The TOML path to the item (e.g., ("project", "dependencies"))
             content: The extracted doc-comment content (without #: markers)
             line_number: The line number where the doc-comment starts
             toml_content: The actual TOML content for this item
         """
-        self.path = path
+        self.path: Tuple[str, ...] = tuple(path)
         self.content = content
+        #: The content pre-split into lines, so node generation never
+        #: re-splits it per doc-comment
+        self.content_lines: Tuple[str, ...] = tuple(content.split("\n"))
         self.line_number = line_number
         self.toml_content = toml_content
-
-    @property
-    def full_path(self) -> str:
-        """Return the full dotted path (e.g., 'project.dependencies')."""
-        return ".".join(self.path) if self.path else ""
-
-    @property
-    def toml_path(self) -> str:
-        """Return the TOML table notation (e.g., '[project.dependencies]')."""
-        if not self.path:
-            return ""
-        return f"[{self.full_path}]"
+        #: The full dotted path (e.g., 'project.dependencies'), computed
+        #: once per distinct path and shared between DocComments
+        full_path = _FULL_PATH_CACHE.get(self.path)
+        if full_path is None:
+            full_path = ".".join(self.path)
+            _FULL_PATH_CACHE[self.path] = full_path
+        self.full_path = full_path
+        #: The TOML table notation (e.g., '[project.dependencies]')
+        self.toml_path = f"[{self.full_path}]" if self.path else ""
 
     def __repr__(self) -> str:
         return f"DocComment(path={self.full_path!r}, line={self.line_number})"
@@ -106,10 +283,6 @@ class DocComment:
 class TomlDocParser:
     """Parser for extracting doc-comments from TOML files according to TOML-Doc spec."""
 
-    DOC_COMMENT_PATTERN = re.compile(r"^#:\s?(.*)")
-    TABLE_PATTERN = re.compile(r"^\[([^\]]+)\]")
-    KEY_PATTERN = re.compile(r"^([a-zA-Z0-9_-]+)\s*=")
-
     def __init__(self, toml_path: Path):
         """
         Initialize the parser.
@@ -118,169 +291,243 @@ class TomlDocParser:
             toml_path: Path to the TOML file to parse
         """
         self.toml_path = toml_path
-        self.raw_content = toml_path.read_text()
-        self.lines = self.raw_content.splitlines()
-        # Parse with tomlkit to extract actual TOML content
-        self.toml_doc = tomlkit.parse(self.raw_content)
-
-    def parse(self) -> List[DocComment]:
+        # Memory-map the file instead of read_text() + splitlines(): the
+        # buffer is shared with the page cache and line strings are only
+        # decoded for the lines the parser actually inspects.
+        with open(toml_path, "rb") as f:
+            try:
+                self._buf: Union[mmap.mmap, bytes] = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                # Empty files cannot be mapped
+                self._buf = b""
+        self._raw_content: Optional[str] = None
+        self._toml_doc: Optional[Any] = None
+        # Buffer offsets of each line's content with surrounding whitespace
+        # excluded, filled in by _classify_lines so no predicate ever needs
+        # to build a stripped copy of a line.
+        self._span_start: List[int] = []
+        self._span_end: List[int] = []
+        self._offsets: List[int] = []
+        self._classes: List[int] = []
+        self._table_at: List[Tuple[str, ...]] = []
+        # Doc-comment blocks can only open at column zero, so a buffer with
+        # no "#:" at the start of any line cannot contain one. A single
+        # C-level bytes.find decides this without building any line arrays.
+        self._has_doc_markers = self._buf[:2] == b"#:" or self._buf.find(b"\n#:") >= 0
+        if self._has_doc_markers:
+            if _accel is not None:
+                # The compiled kernel produces offsets, spans and codes in
+                # one C pass.
+                (
+                    self._offsets,
+                    self._span_start,
+                    self._span_end,
+                    self._classes,
+                ) = _accel.classify_lines(bytes(self._buf[:]))
+            else:
+                self._offsets = self._find_line_offsets()
+                # Classify every line once; parse() and the table index
+                # branch on these codes instead of re-inspecting content.
+                self._classes = self._classify_lines()
+            # Map every line index to the table path active at that line,
+            # built in one forward pass so table lookups are O(1) instead
+            # of a backward scan per key.
+            self._table_at = self._build_table_index()
+            # Files that may yield doc-comments are validated eagerly so
+            # invalid TOML raises here and the directive reports a parse
+            # error (S_EXT_006) even when no valid block is extracted;
+            # marker-free files keep the fully lazy path.
+            self._toml_doc = tomlkit.parse(self.raw_content)
+
+    def _find_line_offsets(self) -> List[int]:
         """
-        Parse the TOML file and extract all valid doc-comments.
+        Locate the start offset of every line in the buffer.
 
         Returns:
-            List of DocComment objects
+            Offsets of each line start, plus one past-the-end sentinel so
+            line i always spans offsets[i]..offsets[i + 1] - 1
         """
-        doc_comments = []
-        i = 0
-
-        while i < len(self.lines):
-            line = self.lines[i]
-
-            # Check if this line starts a doc-comment block
-            if self.DOC_COMMENT_PATTERN.match(line):
-                # Extract the doc-comment block
-                doc_comment = self._extract_doc_comment_block(i)
-                if doc_comment:
-                    doc_comments.append(doc_comment)
-                    # Skip past the doc-comment and the item it documents
-                    i = doc_comment.line_number + len(doc_comment.content.split("\n")) + 1
-                else:
-                    i += 1
-            else:
-                i += 1
-
-        return doc_comments
-
-    def _extract_doc_comment_block(self, start_line: int) -> Optional[DocComment]:
+        offsets = [0]
+        if _np is not None and len(self._buf):
+            arr = _np.frombuffer(self._buf, dtype=_np.uint8)
+            newlines = _np.where(arr == 0x0A)[0]
+            offsets.extend((newlines + 1).tolist())
+        else:
+            find = self._buf.find
+            pos = find(b"\n")
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = find(b"\n", pos + 1)
+        offsets.append(len(self._buf) + 1)
+        return offsets
+
+    def span(self, i: int) -> bytes:
         """
-        Extract a doc-comment block starting at the given line.
+        Return line i's content bytes with surrounding whitespace removed.
+
+        Works entirely in bytes so matching never pays for UTF-8 decoding;
+        callers decode only the fragments they extract.
 
         Args:
-            start_line: The line index where the doc-comment starts (0-indexed)
+            i: The line index (0-indexed)
 
         Returns:
-            DocComment if valid, None otherwise
+            The stripped line content as bytes
         """
-        # First, validate the Separator Rule: must be preceded by empty line
-        if not self._check_separator_rule(start_line):
-            return None
-
-        # Extract all consecutive #: lines
-        doc_lines = []
-        current_line = start_line
-
-        while current_line < len(self.lines):
-            line = self.lines[current_line]
-            match = self.DOC_COMMENT_PATTERN.match(line.strip())
-            if match:
-                doc_lines.append(match.group(1))
-                current_line += 1
-            else:
-                break
-
-        if not doc_lines:
-            return None
-
-        # Find the TOML item that this doc-comment documents
-        # It should be the next non-empty, non-comment line
-        item_line_idx = self._find_next_toml_item(current_line)
-        if item_line_idx is None:
-            return None
-
-        # Validate the Attachment Rule: no empty lines between doc-comment and item
-        if not self._check_attachment_rule(current_line - 1, item_line_idx):
-            return None
+        return bytes(self._buf[self._span_start[i] : self._span_end[i]])
 
-        # Determine the path for this item
-        path = self._get_toml_path_for_line(item_line_idx)
-        if path is None:
-            return None
-
-        # Extract the TOML content for this item
-        toml_content = self._extract_toml_content(path)
+    @property
+    def raw_content(self) -> str:
+        """Return the full decoded file content (decoded on first use)."""
+        if self._raw_content is None:
+            self._raw_content = bytes(self._buf[:]).decode("utf-8")
+        return self._raw_content
 
-        # Create the DocComment
-        content = "\n".join(doc_lines)
-        return DocComment(
-            path=path, content=content, line_number=start_line + 1, toml_content=toml_content
-        )
+    @property
+    def toml_doc(self) -> Any:
+        """Return the tomlkit document, parsed on first use."""
+        if self._toml_doc is None:
+            self._toml_doc = tomlkit.parse(self.raw_content)
+        return self._toml_doc
 
-    def _check_separator_rule(self, doc_start_line: int) -> bool:
+    def _classify_lines(self) -> List[int]:
         """
-        Check the Separator Rule: doc-comment must be preceded by empty line.
+        Classify every line as blank, doc-comment, comment, table, key or other.
 
-        Args:
-            doc_start_line: The line index where the doc-comment starts
+        This is the integer kernel of the parser: one forward pass over the
+        raw bytes that reduces each line to a code, so the stateful parse
+        loop never has to decode or inspect the lines it skips.
 
         Returns:
-            True if valid, False otherwise
+            List of LINE_* codes, one per line
         """
-        # If this is the first line, it's valid
-        if doc_start_line == 0:
-            return True
-
-        # Look backwards for a non-empty line
-        for i in range(doc_start_line - 1, -1, -1):
-            line = self.lines[i].strip()
-            if line:
-                # Found a non-empty line - it should NOT be a doc-comment or TOML item
-                # The line before the doc-comment should be empty
-                return False
+        classes = []
+        buf = self._buf
+        offsets = self._offsets
+        span_start = self._span_start
+        span_end = self._span_end
+        for i in range(len(offsets) - 1):
+            j = offsets[i]
+            end = offsets[i + 1] - 1
+            while j < end and buf[j] in _WS_BYTES:
+                j += 1
+            if j >= end:
+                span_start.append(j)
+                span_end.append(j)
+                classes.append(LINE_BLANK)
+                continue
+            k = end
+            while k > j and buf[k - 1] in _WS_BYTES:
+                k -= 1
+            span_start.append(j)
+            span_end.append(k)
+            first = buf[j]
+            if first == 0x23:  # '#'
+                if j + 1 < end and buf[j + 1] == 0x3A:  # ':'
+                    classes.append(LINE_DOC_COMMENT)
+                else:
+                    classes.append(LINE_COMMENT)
+            elif first == 0x5B:  # '['
+                classes.append(LINE_TABLE)
+            elif _KEY_CHARS[first]:
+                classes.append(LINE_KEY)
             else:
-                # Found an empty line - this satisfies the separator rule
-                return True
-
-        # Reached the beginning of the file
-        return True
+                classes.append(LINE_OTHER)
+        return classes
 
-    def _check_attachment_rule(self, doc_end_line: int, item_line: int) -> bool:
+    def _build_table_index(self) -> List[Tuple[str, ...]]:
         """
-        Check the Attachment Rule: no empty lines between doc-comment and item.
-
-        Args:
-            doc_end_line: The line index where the doc-comment ends
-            item_line: The line index of the TOML item
+        Build a per-line index of the active table path.
 
         Returns:
-            True if valid, False otherwise
+            List where entry i is the table path in effect at line i
         """
-        # Check all lines between doc_end_line and item_line
-        for i in range(doc_end_line + 1, item_line):
-            line = self.lines[i].strip()
-            if line == "":
-                # Found an empty line - violates attachment rule
-                return False
-
-        return True
+        table_at: List[Tuple[str, ...]] = []
+        current: Tuple[str, ...] = ()
+        for i, line_class in enumerate(self._classes):
+            if line_class == LINE_TABLE:
+                table_match = TABLE_PATTERN.fullmatch(self.span(i))
+                if table_match:
+                    current = _split_table_path(table_match.group(1).decode("utf-8"))
+            table_at.append(current)
+        return table_at
 
-    def _find_next_toml_item(self, start_line: int) -> Optional[int]:
+    def parse(self) -> List[DocComment]:
         """
-        Find the next TOML item (table or key) after the given line.
+        Parse the TOML file and extract all valid doc-comments.
 
-        Args:
-            start_line: The line index to start searching from
+        Implemented as a single forward pass: the loop tracks whether the
+        previous line was blank (Separator Rule), collects consecutive ``#:``
+        lines into a pending block, and emits a DocComment when the block's
+        TOML item is reached. A blank line before the item detaches the
+        pending block (Attachment Rule).
 
         Returns:
-            Line index of the next TOML item, or None if not found
+            List of DocComment objects
         """
-        for i in range(start_line, len(self.lines)):
-            line = self.lines[i].strip()
+        if not self._has_doc_markers:
+            return []
+
+        doc_comments: List[DocComment] = []
+        prev_blank = True  # Start of file satisfies the Separator Rule
+        doc_lines: Optional[List[str]] = None  # Pending doc-comment block
+        collecting = False  # Still appending #: lines to the pending block
+        doc_start = 0
+
+        for i, line_class in enumerate(self._classes):
+            if line_class == LINE_BLANK:
+                # Blank line: any pending block is detached from its item
+                # and therefore invalid (Attachment Rule).
+                doc_lines = None
+                collecting = False
+                prev_blank = True
+                continue
 
-            # Skip empty lines and regular comments
-            if not line or (line.startswith("#") and not line.startswith("#:")):
+            if line_class == LINE_DOC_COMMENT:
+                # The marker is at column zero exactly when the content span
+                # starts at the line's own offset (no leading whitespace).
+                at_column_zero = self._span_start[i] == self._offsets[i]
+                if collecting and doc_lines is not None:
+                    doc_lines.append(_strip_doc(self.span(i)))
+                elif prev_blank and at_column_zero:
+                    # A new block may only open after a blank line
+                    # (Separator Rule) and at column zero.
+                    doc_lines = [_strip_doc(self.span(i))]
+                    collecting = True
+                    doc_start = i
+                prev_blank = False
                 continue
 
-            # Check if this is a table header
-            if self.TABLE_PATTERN.match(line):
-                return i
+            prev_blank = False
+            collecting = False
 
-            # Check if this is a key assignment
-            if self.KEY_PATTERN.match(line):
-                return i
+            if line_class == LINE_COMMENT:
+                # A regular comment neither extends nor detaches a block
+                continue
 
-        return None
+            if doc_lines is not None and line_class in (LINE_TABLE, LINE_KEY):
+                # Content line while a block is pending: if it is a table
+                # header or key assignment, this is the documented item.
+                # Either way the block is consumed here - a line that
+                # yields no path drops it rather than letting it migrate
+                # to a later item with the wrong context.
+                path = self._get_toml_path_for_line(i)
+                if path is not None:
+                    doc_comments.append(
+                        DocComment(
+                            path=path,
+                            content="\n".join(doc_lines),
+                            line_number=doc_start + 1,
+                            toml_content=self._extract_toml_content(path),
+                        )
+                    )
+                doc_lines = None
 
-    def _get_toml_path_for_line(self, line_idx: int) -> Optional[List[str]]:
+        return doc_comments
+
+    def _get_toml_path_for_line(self, line_idx: int) -> Optional[Tuple[str, ...]]:
         """
         Get the TOML path for an item at the given line.
 
@@ -288,51 +535,40 @@ class TomlDocParser:
             line_idx: The line index of the TOML item
 
         Returns:
-            List representing the path (e.g., ["project", "dependencies"])
+            Tuple representing the path (e.g., ("project", "dependencies"))
         """
-        line = self.lines[line_idx].strip()
+        line = self.span(line_idx)
 
         # Check if this is a table header
-        table_match = self.TABLE_PATTERN.match(line)
+        table_match = TABLE_PATTERN.fullmatch(line)
         if table_match:
-            table_path = table_match.group(1)
-            return table_path.split(".")
+            return _split_table_path(table_match.group(1).decode("utf-8"))
 
         # Check if this is a key assignment
-        key_match = self.KEY_PATTERN.match(line)
-        if key_match:
-            key_name = key_match.group(1)
+        key_name = _match_key(line)
+        if key_name is not None:
             # Need to find the current table context
-            current_table = self._find_current_table(line_idx)
-            if current_table:
-                return current_table + [key_name]
-            else:
-                return [key_name]
+            return _key_path(self._find_current_table(line_idx), key_name)
 
         return None
 
-    def _find_current_table(self, line_idx: int) -> List[str]:
+    def _find_current_table(self, line_idx: int) -> Tuple[str, ...]:
         """
-        Find the table context for a line by looking backwards.
+        Find the table context for a line via the precomputed index.
 
         Args:
             line_idx: The line index to find the table context for
 
         Returns:
-            List representing the current table path
+            Tuple representing the current table path
         """
-        # Look backwards for the most recent table header
-        for i in range(line_idx - 1, -1, -1):
-            line = self.lines[i].strip()
-            table_match = self.TABLE_PATTERN.match(line)
-            if table_match:
-                table_path = table_match.group(1)
-                return table_path.split(".")
-
-        # No table found, we're at the root level
-        return []
-
-    def _extract_toml_content(self, path: List[str]) -> str:
+        # The index records the table active at each line; the context for
+        # an item is whatever table was open on the preceding line.
+        if line_idx == 0:
+            return ()
+        return self._table_at[line_idx - 1]
+
+    def _extract_toml_content(self, path: Sequence[str]) -> str:
         """
         Extract the TOML content for a given path.
 
@@ -368,6 +604,10 @@ class TomlDocParser:
                     temp_doc.update(item)
                     content = tomlkit.dumps(temp_doc).strip()
                     return content
+                elif isinstance(item, AoT):
+                    # It's an array of tables - serialize every entry under
+                    # its own [[...]] header
+                    return tomlkit.dumps({last_part: item}).strip()
                 else:
                     # It's a key-value pair
                     value_str = tomlkit.dumps({"temp": item}).strip()
@@ -382,10 +622,23 @@ class TomlDocParser:
             return ""
 
 
+# Cache of parse results keyed by resolved path, storing the (mtime_ns,
+# size, result) the entry was built from. Sphinx multi-builder runs and
+# cross-reference resolution re-parse the same TOML file repeatedly; the
+# stat values invalidate an entry when the file changes on disk, and
+# keying by path alone means a changed file replaces its entry instead of
+# accumulating stale ones in long-lived processes (sphinx-autobuild).
+_CACHE: Dict[str, Tuple[int, int, Tuple[DocComment, ...]]] = {}
+
+
 def parse_toml_file(toml_path: Path) -> List[DocComment]:
     """
     Parse a TOML file and extract all doc-comments.
 
+    Results are cached per file and invalidated when the file's mtime or
+    size changes, so repeated calls for an unchanged file (e.g. from
+    multiple Sphinx builders) parse it only once.
+
     Args:
         toml_path: Path to the TOML file
 
@@ -398,5 +651,48 @@ def parse_toml_file(toml_path: Path) -> List[DocComment]:
         >>> for dc in doc_comments:
         ...     print(f"{dc.toml_path}: {dc.content}")
     """
+    stat = toml_path.stat()
+    key = str(toml_path.resolve())
+    entry = _CACHE.get(key)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return list(entry[2])
+
     parser = TomlDocParser(toml_path)
-    return parser.parse()
+    result = parser.parse()
+    _CACHE[key] = (stat.st_mtime_ns, stat.st_size, tuple(result))
+    return result
+
+
+# Parsing is independent per file and largely I/O-bound, so a small shared
+# pool lets the extension overlap parses with Sphinx's own reading phase.
+# The pool is created lazily and tagged with its creating pid: an executor
+# inherited through fork (sphinx-build -j N read workers) has dead threads
+# and submitting to it would block forever, so each process gets its own.
+_PARSE_POOL: Optional[ThreadPoolExecutor] = None
+_PARSE_POOL_PID: Optional[int] = None
+
+
+def _get_parse_pool() -> ThreadPoolExecutor:
+    """Return the thread pool for the current process, recreating it after a fork."""
+    global _PARSE_POOL, _PARSE_POOL_PID
+    pid = os.getpid()
+    if _PARSE_POOL is None or _PARSE_POOL_PID != pid:
+        _PARSE_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        _PARSE_POOL_PID = pid
+    return _PARSE_POOL
+
+
+def parse_toml_file_async(toml_path: Path) -> "Future[List[DocComment]]":
+    """
+    Schedule a TOML file parse on the shared thread pool.
+
+    Combined with the parse cache, scheduling the same file twice costs one
+    parse: the second future resolves from the cache.
+
+    Args:
+        toml_path: Path to the TOML file
+
+    Returns:
+        Future resolving to the list of DocComment objects
+    """
+    return _get_parse_pool().submit(parse_toml_file, toml_path)
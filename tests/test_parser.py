@@ -53,6 +53,18 @@
    :status: implemented
    :tags: parser, extraction, content
    :links: S_PARSER_010
+
+.. test:: Verify parse results are cached and invalidated when the file changes.
+   :id: T_PARSER_010
+   :status: implemented
+   :tags: parser, performance, caching
+   :links: S_PARSER_011
+
+.. test:: Verify asynchronous parsing returns the same results as direct parsing.
+   :id: T_PARSER_011
+   :status: implemented
+   :tags: parser, performance, parallelism
+   :links: S_PARSER_012
 """
 
 from pathlib import Path
@@ -60,7 +72,7 @@ from textwrap import dedent
 
 import pytest
 
-from sphinx_autodoc_toml.parser import DocComment, parse_toml_file
+from sphinx_autodoc_toml.parser import DocComment, parse_toml_file, parse_toml_file_async
 
 
 def test_parse_example_file():
@@ -94,6 +106,7 @@ def test_doc_comment_structure():
         path=["project", "dependencies"], content="This is a test doc-comment", line_number=10
     )
 
+    assert dc.path == ("project", "dependencies")
     assert dc.full_path == "project.dependencies"
     assert dc.toml_path == "[project.dependencies]"
     assert dc.content == "This is a test doc-comment"
@@ -245,12 +258,53 @@ def test_table_header_parsing():
 
     try:
         doc_comments = parse_toml_file(temp_path)
-        project_docs = [dc for dc in doc_comments if dc.path == ["project"]]
+        project_docs = [dc for dc in doc_comments if dc.path == ("project",)]
         assert len(project_docs) > 0, "Should extract doc-comment for table header"
         assert project_docs[0].toml_path == "[project]"
     finally:
         temp_path.unlink()
 
+    # Whitespace around the table name is valid TOML and must be trimmed
+    spaced_toml = dedent("""
+
+        #: Project configuration
+        [ project ]
+        name = "test"
+    """).strip()
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+        f.write(spaced_toml)
+        temp_path = Path(f.name)
+
+    try:
+        doc_comments = parse_toml_file(temp_path)
+        project_docs = [dc for dc in doc_comments if dc.path == ("project",)]
+        assert len(project_docs) > 0, "Should extract doc-comment for spaced table header"
+        # The block must not migrate to a later key either way
+        assert all(dc.path == ("project",) for dc in doc_comments)
+    finally:
+        temp_path.unlink()
+
+    # Array-of-tables headers use doubled brackets and must also attach
+    aot_toml = dedent("""
+
+        #: MyPy overrides for third-party libraries.
+        [[tool.mypy.overrides]]
+        module = "docutils.*"
+    """).strip()
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+        f.write(aot_toml)
+        temp_path = Path(f.name)
+
+    try:
+        doc_comments = parse_toml_file(temp_path)
+        override_docs = [dc for dc in doc_comments if dc.path == ("tool", "mypy", "overrides")]
+        assert len(override_docs) > 0, "Should extract doc-comment for array-of-tables header"
+        assert "docutils" in override_docs[0].toml_content
+    finally:
+        temp_path.unlink()
+
 
 def test_key_value_parsing():
     """Test that key-value pairs are identified correctly.
@@ -272,7 +326,7 @@ def test_key_value_parsing():
 
     try:
         doc_comments = parse_toml_file(temp_path)
-        name_docs = [dc for dc in doc_comments if dc.path == ["project", "name"]]
+        name_docs = [dc for dc in doc_comments if dc.path == ("project", "name")]
         assert len(name_docs) > 0, "Should extract doc-comment for key-value pair"
     finally:
         temp_path.unlink()
@@ -300,7 +354,7 @@ def test_hierarchical_paths():
         doc_comments = parse_toml_file(temp_path)
         nested_docs = [dc for dc in doc_comments if "tool" in dc.path]
         assert len(nested_docs) > 0, "Should extract doc-comment for nested table"
-        assert nested_docs[0].path == ["tool", "myproject", "settings"]
+        assert nested_docs[0].path == ("tool", "myproject", "settings")
         assert nested_docs[0].full_path == "tool.myproject.settings"
     finally:
         temp_path.unlink()
@@ -326,7 +380,7 @@ def test_toml_content_extraction():
 
     try:
         doc_comments = parse_toml_file(temp_path)
-        name_docs = [dc for dc in doc_comments if dc.path == ["project", "name"]]
+        name_docs = [dc for dc in doc_comments if dc.path == ("project", "name")]
         assert len(name_docs) > 0, "Should extract doc-comment"
         assert name_docs[0].toml_content, "Should extract TOML content"
         assert "test-project" in name_docs[0].toml_content
@@ -334,6 +388,68 @@ def test_toml_content_extraction():
         temp_path.unlink()
 
 
+def test_parse_result_caching():
+    """Test that parse results are cached and invalidated on file changes.
+
+    Implements: T_PARSER_010
+    """
+    toml_content = dedent("""
+        [project]
+
+        #: The project name
+        name = "test"
+    """).strip()
+
+    import tempfile
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+        f.write(toml_content)
+        temp_path = Path(f.name)
+
+    try:
+        first = parse_toml_file(temp_path)
+        second = parse_toml_file(temp_path)
+        assert len(first) == len(second) == 1
+        # A cache hit returns the same DocComment objects, not a re-parse
+        assert first[0] is second[0], "Unchanged file should hit the cache"
+
+        # Modifying the file invalidates the cache entry
+        temp_path.write_text(toml_content.replace("project name", "package name"))
+        third = parse_toml_file(temp_path)
+        assert len(third) == 1
+        assert "package name" in third[0].content
+    finally:
+        temp_path.unlink()
+
+
+def test_async_parsing_matches_direct_parsing():
+    """Test that parse_toml_file_async resolves to the same doc-comments.
+
+    Implements: T_PARSER_011
+    """
+    toml_content = dedent("""
+        [project]
+
+        #: The project name
+        name = "test"
+    """).strip()
+
+    import tempfile
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+        f.write(toml_content)
+        temp_path = Path(f.name)
+
+    try:
+        async_result = parse_toml_file_async(temp_path).result()
+        direct_result = parse_toml_file(temp_path)
+        assert len(async_result) == len(direct_result) == 1
+        assert async_result[0].path == direct_result[0].path
+        assert async_result[0].content == direct_result[0].content
+    finally:
+        temp_path.unlink()
+
+
 if __name__ == "__main__":
     # Run a simple test
     test_parse_example_file()